@@ -15,6 +15,10 @@ MAX_WORKERS = int(os.getenv("BCD_MAX_WORKERS", "8"))
 SSH_TIMEOUT = float(os.getenv("BCD_SSH_TIMEOUT", "30"))
 SSH_COMMAND_TIMEOUT = float(os.getenv("BCD_SSH_COMMAND_TIMEOUT", "30"))
 SSH_HEALTHCHECK_INTERVAL = float(os.getenv("BCD_SSH_HEALTHCHECK_INTERVAL", "10"))
+SSH_COMPRESSION = os.getenv("BCD_SSH_COMPRESSION", "false").lower() == "true"
+SSH_CONCURRENCY = int(os.getenv("BCD_SSH_CONCURRENCY", "32"))
+STATS_TTL = float(os.getenv("BCD_STATS_TTL", "2"))
+SSH_BROKER_SOCKET = os.getenv("BCD_SSH_BROKER_SOCKET", "")
 CORS_ORIGINS = [
     origin.strip()
     for origin in os.getenv("BCD_CORS_ORIGINS", "*").split(",")
@@ -1,10 +1,37 @@
 from __future__ import annotations
 
-import subprocess
+import os
 from pathlib import Path
 
+from cryptography.exceptions import UnsupportedAlgorithm
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
 from app.core.config import ROOT_DIR
 
+KEY_COMMENT = "better-call-dally-watcher"
+
+
+def _load_private_key(data: bytes):
+    try:
+        return serialization.load_ssh_private_key(data, password=None)
+    except ValueError:
+        return serialization.load_pem_private_key(data, password=None)
+
+
+def _public_key_line(private_key) -> str:
+    public = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.OpenSSH,
+        format=serialization.PublicFormat.OpenSSH,
+    )
+    return f"{public.decode('ascii')} {KEY_COMMENT}\n"
+
+
+def _write_private_key(path: Path, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as handle:
+        handle.write(data)
+
 
 def ensure_watcher_keypair() -> None:
     key_dir = ROOT_DIR / "keys"
@@ -17,31 +44,20 @@ def ensure_watcher_keypair() -> None:
     key_dir.mkdir(parents=True, exist_ok=True)
 
     if private_key.exists() and not public_key.exists():
-        cmd = [
-            "ssh-keygen",
-            "-y",
-            "-f",
-            str(private_key),
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            message = (result.stderr or result.stdout).strip()
-            raise RuntimeError(message or "Failed to derive watcher public key")
-        public_key.write_text(result.stdout.strip() + "\n", encoding="utf-8")
+        try:
+            key = _load_private_key(private_key.read_bytes())
+        except (TypeError, UnsupportedAlgorithm, ValueError) as exc:
+            raise RuntimeError(f"Failed to derive watcher public key: {exc}") from exc
+        public_key.write_text(_public_key_line(key), encoding="utf-8")
         return
 
-    cmd = [
-        "ssh-keygen",
-        "-t",
-        "ed25519",
-        "-f",
-        str(private_key),
-        "-N",
-        "",
-        "-C",
-        "better-call-dally-watcher",
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        message = (result.stderr or result.stdout).strip()
-        raise RuntimeError(message or "Failed to generate watcher keypair")
+    key = Ed25519PrivateKey.generate()
+    _write_private_key(
+        private_key,
+        key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.OpenSSH,
+            encryption_algorithm=serialization.NoEncryption(),
+        ),
+    )
+    public_key.write_text(_public_key_line(key), encoding="utf-8")
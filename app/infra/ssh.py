@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
 import json
 import re
 import shlex
+import time
 from dataclasses import dataclass
 import base64
 from pathlib import Path
@@ -11,7 +13,14 @@ import paramiko
 
 import socket
 
-from app.core.config import ROOT_DIR, SSH_COMMAND_TIMEOUT, SSH_TIMEOUT
+from app.core import fastjson
+from app.core.config import (
+    ROOT_DIR,
+    SSH_COMMAND_TIMEOUT,
+    SSH_COMPRESSION,
+    SSH_HEALTHCHECK_INTERVAL,
+    SSH_TIMEOUT,
+)
 from app.servers.models import Server
 from app.stats.models import (
     CpuInfo,
@@ -34,33 +43,32 @@ class SshResult:
     exit_code: int
 
 
+@functools.lru_cache(maxsize=16)
+def redaction_pattern(secret: str) -> re.Pattern[str]:
+    escaped = re.escape(secret)
+    return re.compile(rf"(?P<line>^[^\S\n]*{escaped}[^\S\n]*(?:\n|\Z))|{escaped}", re.MULTILINE)
+
+
+def _redact_match(match: re.Match[str]) -> str:
+    return "" if match.group("line") is not None else "[redacted]"
+
+
 def redact_output(text: str, secret: str | None) -> str:
-    if not text or not secret:
+    if not text or not secret or secret not in text:
         return text
-    lines = text.splitlines()
-    filtered: list[str] = []
-    for line in lines:
-        if line.strip() == secret:
-            continue
-        filtered.append(line.replace(secret, "[redacted]"))
-    result = "\n".join(filtered)
-    if text.endswith("\n"):
-        result += "\n"
-    return result
+    return redaction_pattern(secret).sub(_redact_match, text)
+
+
+BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 
 def format_bytes(value: int | None) -> str:
     if value is None:
         return "n/a"
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    size = float(value)
-    for unit in units:
-        if size < 1024 or unit == units[-1]:
-            if unit == "B":
-                return f"{int(size)} {unit}"
-            return f"{size:.2f} {unit}"
-        size /= 1024
-    return f"{size:.2f} PB"
+    if value < 1024:
+        return f"{int(value)} B"
+    index = min((int(value).bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+    return f"{value / (1 << (index * 10)):.2f} {BYTE_UNITS[index]}"
 
 
 def format_seconds(seconds: float | None) -> str:
@@ -79,35 +87,67 @@ def format_seconds(seconds: float | None) -> str:
     return f"{seconds}s"
 
 
-def run_command(
+def read_stream(recv) -> bytearray:
+    buffer = bytearray()
+    while True:
+        chunk = recv(65536)
+        if not chunk:
+            return buffer
+        buffer += chunk
+
+
+@dataclass
+class PendingCommand:
+    channel: paramiko.Channel
+    stdin: paramiko.ChannelFile
+    secret: str | None = None
+
+    def result(self) -> SshResult:
+        try:
+            out = read_stream(self.channel.recv).decode("utf-8", errors="replace")
+            err = read_stream(self.channel.recv_stderr).decode("utf-8", errors="replace")
+            exit_status = self.channel.recv_exit_status()
+        except socket.timeout:
+            return SshResult(stdout="", stderr="command timeout", exit_code=124)
+        return SshResult(
+            stdout=redact_output(out, self.secret),
+            stderr=redact_output(err, self.secret),
+            exit_code=exit_status,
+        )
+
+
+def start_command(
     client: paramiko.SSHClient,
     command: str,
     *,
     use_pty: bool = False,
     login_shell: bool = False,
-) -> SshResult:
+) -> PendingCommand:
     if login_shell:
         command = f"bash -lc {shlex.quote(command)}"
     stdin, stdout, stderr = client.exec_command(command, get_pty=use_pty)
     stdout.channel.settimeout(SSH_COMMAND_TIMEOUT)
-    stderr.channel.settimeout(SSH_COMMAND_TIMEOUT)
-    try:
-        exit_status = stdout.channel.recv_exit_status()
-        out = stdout.read().decode("utf-8", errors="replace")
-        err = stderr.read().decode("utf-8", errors="replace")
-    except socket.timeout:
-        return SshResult(stdout="", stderr="command timeout", exit_code=124)
-    return SshResult(stdout=out, stderr=err, exit_code=exit_status)
+    return PendingCommand(channel=stdout.channel, stdin=stdin)
 
 
-def run_sudo_command(
+def run_command(
+    client: paramiko.SSHClient,
+    command: str,
+    *,
+    use_pty: bool = False,
+    login_shell: bool = False,
+) -> SshResult:
+    return start_command(client, command, use_pty=use_pty, login_shell=login_shell).result()
+
+
+def start_sudo_command(
     client: paramiko.SSHClient,
     command: str,
     *,
     password: str,
     user: str = "root",
     login_shell: bool = False,
-) -> SshResult:
+) -> PendingCommand:
     if login_shell:
         command = f"bash -lc {shlex.quote(command)}"
     sudo_inner = f"sudo -S -p '' -u {shlex.quote(user)} /bin/sh -c {shlex.quote(command)}"
@@ -120,20 +160,26 @@ def run_sudo_command(
     )
     stdin, stdout, stderr = client.exec_command(sudo_command, get_pty=True)
     stdout.channel.settimeout(SSH_COMMAND_TIMEOUT)
-    stderr.channel.settimeout(SSH_COMMAND_TIMEOUT)
     stdin.write(password + "\n")
     stdin.flush()
-    try:
-        exit_status = stdout.channel.recv_exit_status()
-        out = stdout.read().decode("utf-8", errors="replace")
-        err = stderr.read().decode("utf-8", errors="replace")
-    except socket.timeout:
-        return SshResult(stdout="", stderr="command timeout", exit_code=124)
-    return SshResult(
-        stdout=redact_output(out, password),
-        stderr=redact_output(err, password),
-        exit_code=exit_status,
-    )
+    return PendingCommand(channel=stdout.channel, stdin=stdin, secret=password)
+
+
+def run_sudo_command(
+    client: paramiko.SSHClient,
+    command: str,
+    *,
+    password: str,
+    user: str = "root",
+    login_shell: bool = False,
+) -> SshResult:
+    return start_sudo_command(
+        client,
+        command,
+        password=password,
+        user=user,
+        login_shell=login_shell,
+    ).result()
 
 
 def read_public_key(path: Path) -> str:
@@ -180,13 +226,10 @@ def install_root_key(
         raise RuntimeError(message or "Failed to install root key")
 
 
-def fetch_memory(client: paramiko.SSHClient) -> tuple[int | None, int | None]:
-    result = run_command(client, "cat /proc/meminfo")
-    if result.exit_code != 0:
-        return None, None
+def parse_memory(text: str) -> tuple[int | None, int | None]:
     total = None
     available = None
-    for line in result.stdout.splitlines():
+    for line in text.splitlines():
         if line.startswith("MemTotal:"):
             total = int(line.split()[1]) * 1024
         elif line.startswith("MemAvailable:"):
@@ -197,41 +240,16 @@ def fetch_memory(client: paramiko.SSHClient) -> tuple[int | None, int | None]:
     return total, used
 
 
-def fetch_uptime(client: paramiko.SSHClient) -> float | None:
-    result = run_command(client, "cat /proc/uptime")
-    if result.exit_code != 0:
-        return None
+def parse_uptime(text: str) -> float | None:
     try:
-        return float(result.stdout.split()[0])
+        return float(text.split()[0])
     except (ValueError, IndexError):
         return None
 
 
-def fetch_disk(client: paramiko.SSHClient) -> tuple[int | None, int | None]:
-    result = run_command(client, "df -B1 /")
-    if result.exit_code != 0:
-        return None, None
-    lines = result.stdout.splitlines()
-    if len(lines) < 2:
-        return None, None
-    parts = lines[1].split()
-    if len(parts) < 6:
-        return None, None
-    try:
-        total = int(parts[1])
-        used = int(parts[2])
-    except ValueError:
-        return None, None
-    return total, used
-
-
-def fetch_disk(client: paramiko.SSHClient, mount_filters: list[str] | None = None) -> list[DiskInfo]:
-    result = run_command(client, "df -B1 | grep -E '^/dev' | grep -v '/dev/loop'")
-    if result.exit_code != 0:
-        return []
-
+def parse_disks(text: str, mount_filters: list[str] | None = None) -> list[DiskInfo]:
     disks: list[DiskInfo] = []
-    for line in result.stdout.splitlines():
+    for line in text.splitlines():
         parts = line.split()
         if len(parts) < 5:
             continue
@@ -256,69 +274,200 @@ def fetch_disk(client: paramiko.SSHClient, mount_filters: list[str] | None = Non
     return disks
 
 
-def fetch_cpu(client: paramiko.SSHClient) -> tuple[int | None, float | None]:
-    cores_result = run_command(client, "command -v nproc >/dev/null 2>&1 && nproc || getconf _NPROCESSORS_ONLN")
-    if cores_result.exit_code == 0:
-        try:
-            cores = int(cores_result.stdout.strip())
-        except (TypeError, ValueError):
-            cores = None
-    else:
-        cores = None
-
-    usage_script = (
-        "read cpu user nice system idle iowait irq softirq steal guest guest_nice < /proc/stat; "
-        "total1=$((user+nice+system+idle+iowait+irq+softirq+steal)); "
-        "idle1=$((idle+iowait)); "
-        "sleep 0.5; "
-        "read cpu user nice system idle iowait irq softirq steal guest guest_nice < /proc/stat; "
-        "total2=$((user+nice+system+idle+iowait+irq+softirq+steal)); "
-        "idle2=$((idle+iowait)); "
-        "total=$((total2-total1)); "
-        "idle=$((idle2-idle1)); "
-        "if [ \"$total\" -gt 0 ]; then "
-        "usage=$(awk \"BEGIN {print (1-($idle/$total))*100}\"); "
-        "printf \"%.2f\" \"$usage\"; "
-        "else echo \"0.00\"; "
-        "fi"
+def parse_cpu_cores(text: str) -> int | None:
+    try:
+        return int(text.strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_cpu_snapshot(line: str) -> tuple[int, int] | None:
+    parts = line.split()
+    if len(parts) < 5 or parts[0] != "cpu":
+        return None
+    try:
+        values = [int(value) for value in parts[1:9]]
+    except ValueError:
+        return None
+    values += [0] * (8 - len(values))
+    return sum(values), values[3] + values[4]
+
+
+def cpu_usage_between(previous: tuple[int, int], current: tuple[int, int]) -> float | None:
+    total = current[0] - previous[0]
+    idle = current[1] - previous[1]
+    if total < 0 or idle < 0:
+        return None
+    if total == 0:
+        return None
+    return round((1 - idle / total) * 100, 2)
+
+
+CPU_STAT_COMMAND = "read -r line < /proc/stat; echo \"$line\""
+CPU_SNAPSHOT_MIN_AGE = 1.0
+CPU_SNAPSHOT_MAX_AGE = 3 * SSH_HEALTHCHECK_INTERVAL
+
+BASIC_STATS_PREFIX = (
+    "echo ===MEM===; cat /proc/meminfo; "
+    "echo ===UPTIME===; read -r line < /proc/uptime; echo \"$line\"; "
+    "echo ===DISK===; df -B1 | grep -E '^/dev' | grep -v '/dev/loop'; "
+    "echo ===CORES===; command -v nproc >/dev/null 2>&1 && nproc || getconf _NPROCESSORS_ONLN; "
+)
+
+
+def build_basic_stats_script(*, sample_cpu: bool) -> str:
+    cpu_command = CPU_STAT_COMMAND
+    if sample_cpu:
+        cpu_command = f"{CPU_STAT_COMMAND}; sleep 0.5; {CPU_STAT_COMMAND}"
+    return f"{BASIC_STATS_PREFIX}echo ===CPU===; {cpu_command}"
+
+
+SECTION_MARKER = re.compile(r"^===(?P<name>[A-Z]+)===$")
+
+
+@dataclass
+class HostState:
+    prev_cpu_snapshot: tuple[int, int] | None = None
+    prev_cpu_at: float = 0.0
+    pm2_last_target: tuple[str | None, str | None] | None = None
+
+
+@dataclass
+class BasicStats:
+    cpu_cores: int | None
+    cpu_usage: float | None
+    mem_total: int | None
+    mem_used: int | None
+    uptime_seconds: float | None
+    disks: list[DiskInfo]
+
+
+def split_sections(text: str) -> dict[str, str]:
+    sections: dict[str, list[str]] = {}
+    current: list[str] | None = None
+    for line in text.splitlines():
+        match = SECTION_MARKER.match(line)
+        if match:
+            current = sections.setdefault(match.group("name"), [])
+            continue
+        if current is not None:
+            current.append(line)
+    return {name: "\n".join(lines) for name, lines in sections.items()}
+
+
+def recent_cpu_snapshot(state: HostState | None) -> tuple[int, int] | None:
+    if state is None or state.prev_cpu_snapshot is None:
+        return None
+    age = time.monotonic() - state.prev_cpu_at
+    if age < CPU_SNAPSHOT_MIN_AGE or age > CPU_SNAPSHOT_MAX_AGE:
+        return None
+    return state.prev_cpu_snapshot
+
+
+def start_basic_stats(client: paramiko.SSHClient, state: HostState | None = None) -> PendingCommand:
+    previous = recent_cpu_snapshot(state)
+    return start_command(client, build_basic_stats_script(sample_cpu=previous is None))
+
+
+def parse_basic_stats(
+    result: SshResult,
+    mount_filters: list[str] | None = None,
+    state: HostState | None = None,
+) -> BasicStats:
+    previous = state.prev_cpu_snapshot if state is not None else None
+    sections = split_sections(result.stdout)
+    mem_total, mem_used = parse_memory(sections.get("MEM", ""))
+
+    snapshots: list[tuple[int, int]] = []
+    for line in sections.get("CPU", "").splitlines():
+        snapshot = parse_cpu_snapshot(line)
+        if snapshot is not None:
+            snapshots.append(snapshot)
+    cpu_usage = None
+    if len(snapshots) > 1:
+        cpu_usage = cpu_usage_between(snapshots[0], snapshots[-1])
+    elif snapshots and previous is not None:
+        cpu_usage = cpu_usage_between(previous, snapshots[0])
+    if snapshots and state is not None:
+        state.prev_cpu_snapshot = snapshots[-1]
+        state.prev_cpu_at = time.monotonic()
+
+    return BasicStats(
+        cpu_cores=parse_cpu_cores(sections.get("CORES", "")),
+        cpu_usage=cpu_usage,
+        mem_total=mem_total,
+        mem_used=mem_used,
+        uptime_seconds=parse_uptime(sections.get("UPTIME", "")),
+        disks=parse_disks(sections.get("DISK", ""), mount_filters),
     )
-    usage_result = run_command(client, usage_script, login_shell=True)
-    if usage_result.exit_code == 0:
-        try:
-            usage_percent = float(usage_result.stdout.strip())
-        except (TypeError, ValueError):
-            usage_percent = None
-    else:
-        usage_percent = None
-    return cores, usage_percent
+
+
+def fetch_basic_stats(
+    client: paramiko.SSHClient,
+    mount_filters: list[str] | None = None,
+    state: HostState | None = None,
+) -> BasicStats:
+    result = start_basic_stats(client, state).result()
+    return parse_basic_stats(result, mount_filters, state)
 
 
 def extract_json_array(text: str) -> list[dict] | None:
+    idx = text.find("[")
+    if idx < 0:
+        return None
+    end = text.rfind("]")
+    if end > idx:
+        try:
+            data = fastjson.loads(text[idx:end + 1])
+        except json.JSONDecodeError:
+            data = None
+        if isinstance(data, list):
+            return data
     decoder = json.JSONDecoder()
-    for idx, char in enumerate(text):
-        if char != "[":
-            continue
+    while idx >= 0:
         try:
-            data, _ = decoder.raw_decode(text[idx:])
+            data, _ = decoder.raw_decode(text, idx)
         except json.JSONDecodeError:
-            continue
+            data = None
         if isinstance(data, list):
             return data
+        idx = text.find("[", idx + 1)
     return None
 
 
+PM2_BOOTSTRAP = (
+    "set -o pipefail; "
+    "[ -f ~/.bashrc ] && . ~/.bashrc >/dev/null 2>&1; "
+    "[ -f ~/.profile ] && . ~/.profile >/dev/null 2>&1; "
+    "[ -s ~/.nvm/nvm.sh ] && . ~/.nvm/nvm.sh >/dev/null 2>&1; "
+)
+
+
+@functools.lru_cache(maxsize=64)
 def build_pm2_script(pm2_home: str | None) -> str:
-    env_parts: list[str] = []
-    if pm2_home:
-        env_parts.append(f"PM2_HOME={shlex.quote(pm2_home)}")
-    env_prefix = " ".join(env_parts)
-    bootstrap = (
-        "set -o pipefail; "
-        "[ -f ~/.bashrc ] && . ~/.bashrc >/dev/null 2>&1; "
-        "[ -f ~/.profile ] && . ~/.profile >/dev/null 2>&1; "
-        "[ -s ~/.nvm/nvm.sh ] && . ~/.nvm/nvm.sh >/dev/null 2>&1; "
-    )
-    return f"{bootstrap}{env_prefix} pm2 jlist".strip()
+    env_prefix = f"PM2_HOME={shlex.quote(pm2_home)}" if pm2_home else ""
+    return f"{PM2_BOOTSTRAP}{env_prefix} pm2 jlist".strip()
+
+
+@functools.lru_cache(maxsize=64)
+def build_pm2_command(pm2_user: str | None, pm2_home: str | None) -> str:
+    script = shlex.quote(build_pm2_script(pm2_home))
+    if pm2_user:
+        return f"sudo -n -u {shlex.quote(pm2_user)} -H bash -lc {script}"
+    return f"bash -lc {script}"
+
+
+def start_pm2(
+    client: paramiko.SSHClient,
+    *,
+    pm2_user: str | None,
+    pm2_home: str | None,
+    sudo_password: str | None,
+) -> PendingCommand:
+    if pm2_user and sudo_password:
+        script = build_pm2_script(pm2_home)
+        return start_sudo_command(client, script, password=sudo_password, user=pm2_user, login_shell=True)
+    return start_command(client, build_pm2_command(pm2_user, pm2_home), use_pty=True)
 
 
 def fetch_pm2_details(
@@ -328,16 +477,11 @@ def fetch_pm2_details(
     pm2_home: str | None,
     sudo_password: str | None,
 ) -> tuple[Pm2Info, str | None]:
-    script = build_pm2_script(pm2_home)
-    if pm2_user:
-        command = f"sudo -n -u {shlex.quote(pm2_user)} -H bash -lc {shlex.quote(script)}"
-        if sudo_password:
-            result = run_sudo_command(client, script, password=sudo_password, user=pm2_user, login_shell=True)
-        else:
-            result = run_command(client, command, use_pty=True)
-    else:
-        command = f"bash -lc {shlex.quote(script)}"
-        result = run_command(client, command, use_pty=True)
+    pending = start_pm2(client, pm2_user=pm2_user, pm2_home=pm2_home, sudo_password=sudo_password)
+    return parse_pm2_result(pending.result())
+
+
+def parse_pm2_result(result: SshResult) -> tuple[Pm2Info, str | None]:
     payload = extract_json_array(result.stdout) or extract_json_array(result.stderr)
     if payload is None:
         message = (result.stderr or result.stdout).strip()
@@ -398,41 +542,45 @@ SUPERVISOR_LINE = re.compile(
 def parse_supervisor(lines: list[str]) -> SupervisorInfo:
     if not lines:
         return SupervisorInfo(total=None, running=None, details=None)
-    total = 0
+    match_line = SUPERVISOR_LINE.match
+    process = SupervisorProcess
     running = 0
     details: list[SupervisorProcess] = []
     for line in lines:
-        total += 1
-        match = SUPERVISOR_LINE.match(line)
+        match = match_line(line)
         if match:
-            info = match.groupdict()
-            state = info.get("state")
+            name, state, pid, uptime, message = match.group("name", "state", "pid", "uptime", "message")
             if state == "RUNNING":
                 running += 1
-            pid = info.get("pid")
             details.append(
-                SupervisorProcess(
-                    name=info.get("name"),
+                process(
+                    name=name,
                     state=state,
-                    pid=int(pid) if pid and pid.isdigit() else None,
-                    uptime=info.get("uptime"),
-                    message=info.get("message"),
+                    pid=int(pid) if pid else None,
+                    uptime=uptime,
+                    message=message,
                     raw=line,
                 )
             )
         else:
-            details.append(SupervisorProcess(raw=line))
-    return SupervisorInfo(total=total, running=running, details=details)
+            details.append(process(raw=line))
+    return SupervisorInfo(total=len(lines), running=running, details=details)
 
 
-def fetch_supervisor(
+SUPERVISOR_COMMAND = "command -v supervisorctl >/dev/null 2>&1 && supervisorctl status || true"
+
+
+def start_supervisor(client: paramiko.SSHClient) -> PendingCommand:
+    return start_command(client, SUPERVISOR_COMMAND, login_shell=True)
+
+
+def finish_supervisor(
     client: paramiko.SSHClient,
+    result: SshResult,
     *,
     sudo_password: str | None,
     ssh_user: str,
 ) -> SupervisorInfo:
-    command = "command -v supervisorctl >/dev/null 2>&1 && supervisorctl status || true"
-    result = run_command(client, command, login_shell=True)
     lines = [line.strip() for line in result.stdout.splitlines() if line.strip()]
     joined = "\n".join(lines + [result.stderr.strip()]).lower()
     if (
@@ -451,6 +599,16 @@ def fetch_supervisor(
     return parse_supervisor(lines)
 
 
+def fetch_supervisor(
+    client: paramiko.SSHClient,
+    *,
+    sudo_password: str | None,
+    ssh_user: str,
+) -> SupervisorInfo:
+    result = start_supervisor(client).result()
+    return finish_supervisor(client, result, sudo_password=sudo_password, ssh_user=ssh_user)
+
+
 def resolve_key_path(server: Server) -> Path | None:
     key_path = Path(server.key_path) if server.key_path else None
     if key_path and not key_path.is_absolute():
@@ -458,6 +616,30 @@ def resolve_key_path(server: Server) -> Path | None:
     return key_path
 
 
+_PRIVATE_KEYS: dict[Path, tuple[int, paramiko.PKey]] = {}
+
+
+def load_private_key(server: Server) -> paramiko.PKey | None:
+    key_path = resolve_key_path(server)
+    if key_path is None:
+        return None
+    mtime = key_path.stat().st_mtime_ns
+    cached = _PRIVATE_KEYS.get(key_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    pkey = paramiko.PKey.from_path(key_path, passphrase=server.get_password())
+    _PRIVATE_KEYS[key_path] = (mtime, pkey)
+    return pkey
+
+
+def key_auth(server: Server) -> dict[str, paramiko.PKey | str | None]:
+    try:
+        return {"pkey": load_private_key(server), "key_filename": None}
+    except (OSError, paramiko.SSHException, paramiko.pkey.UnknownKeyType):
+        key_path = resolve_key_path(server)
+        return {"pkey": None, "key_filename": str(key_path) if key_path else None}
+
+
 def build_error_stats(server: Server, message: str) -> HostStats:
     return HostStats(
         server_id=server.id,
@@ -476,37 +658,65 @@ def build_error_stats(server: Server, message: str) -> HostStats:
     )
 
 
+def normalize_detail(detail: str) -> str:
+    if detail.lower() in ("summary", "basic"):
+        return "summary"
+    return "full"
+
+
+def pm2_targets(server: Server, state: HostState | None = None) -> list[tuple[str | None, str | None]]:
+    targets = [(server.pm2_user, server.pm2_home)]
+    if server.password and server.user != "root":
+        fallback = ("root", server.pm2_home or "/root/.pm2")
+        if state is not None and state.pm2_last_target == fallback:
+            targets.insert(0, fallback)
+        else:
+            targets.append(fallback)
+    return targets
+
+
 def collect_stats(
     client: paramiko.SSHClient,
     server: Server,
     *,
     detail: str = "full",
+    state: HostState | None = None,
 ) -> HostStats:
-    cpu_cores, cpu_usage = fetch_cpu(client)
-    mem_total, mem_used = fetch_memory(client)
-    uptime_seconds = fetch_uptime(client)
-    disks_info = fetch_disk(client, server.disks_monitored)
-    detail_level = detail.lower()
+    detail_level = normalize_detail(detail)
+    basic_command = start_basic_stats(client, state)
     if detail_level == "summary":
+        basic = parse_basic_stats(basic_command.result(), server.disks_monitored, state)
         pm2_info = Pm2Info(error="skipped")
         supervisor_info = SupervisorInfo()
     else:
-        pm2_info, _ = fetch_pm2_details(
+        sudo_password = server.get_password() if server.user != "root" else None
+        targets = pm2_targets(server, state)
+        pm2_target = targets[0]
+        pm2_command = start_pm2(
             client,
-            pm2_user=server.pm2_user,
-            pm2_home=server.pm2_home,
-            sudo_password=server.get_password() if server.user != "root" else None,
+            pm2_user=pm2_target[0],
+            pm2_home=pm2_target[1],
+            sudo_password=sudo_password,
         )
-        if pm2_info.error and server.password and server.user != "root":
+        supervisor_command = start_supervisor(client)
+        basic = parse_basic_stats(basic_command.result(), server.disks_monitored, state)
+        pm2_info, _ = parse_pm2_result(pm2_command.result())
+        for fallback in targets[1:]:
+            if not pm2_info.error:
+                break
+            pm2_target = fallback
             pm2_info, _ = fetch_pm2_details(
                 client,
-                pm2_user="root",
-                pm2_home=server.pm2_home or "/root/.pm2",
-                sudo_password=server.get_password(),
+                pm2_user=fallback[0],
+                pm2_home=fallback[1],
+                sudo_password=sudo_password,
             )
-        supervisor_info = fetch_supervisor(
+        if not pm2_info.error and state is not None:
+            state.pm2_last_target = pm2_target
+        supervisor_info = finish_supervisor(
             client,
-            sudo_password=server.get_password() if server.user != "root" else None,
+            supervisor_command.result(),
+            sudo_password=sudo_password,
             ssh_user=server.user,
         )
 
@@ -519,18 +729,18 @@ def collect_stats(
         tags=server.tags,
         error=None,
         cpu=CpuInfo(
-            cores=cpu_cores,
-            usage_percent=cpu_usage,
-            usage_human="n/a" if cpu_usage is None else f"{cpu_usage:.2f}%",
+            cores=basic.cpu_cores,
+            usage_percent=basic.cpu_usage,
+            usage_human="n/a" if basic.cpu_usage is None else f"{basic.cpu_usage:.2f}%",
         ),
         memory=MemoryInfo(
-            total_bytes=mem_total,
-            used_bytes=mem_used,
-            total_human=format_bytes(mem_total),
-            used_human=format_bytes(mem_used),
+            total_bytes=basic.mem_total,
+            used_bytes=basic.mem_used,
+            total_human=format_bytes(basic.mem_total),
+            used_human=format_bytes(basic.mem_used),
         ),
-        uptime=UptimeInfo(seconds=uptime_seconds, human=format_seconds(uptime_seconds)),
-        disks=DisksInfo(disks=disks_info),
+        uptime=UptimeInfo(seconds=basic.uptime_seconds, human=format_seconds(basic.uptime_seconds)),
+        disks=DisksInfo(disks=basic.disks),
         pm2=pm2_info,
         supervisor=supervisor_info,
     )
@@ -540,17 +750,17 @@ def gather_stats(server: Server) -> HostStats:
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
-    key_path = resolve_key_path(server)
     try:
         client.connect(
             hostname=server.host,
             port=server.port,
             username=server.user,
             password=server.get_password(),
-            key_filename=str(key_path) if key_path else None,
+            **key_auth(server),
             allow_agent=False,
             look_for_keys=False,
             timeout=SSH_TIMEOUT,
+            compress=SSH_COMPRESSION,
         )
         return collect_stats(client, server)
     except Exception as exc:
@@ -563,15 +773,13 @@ def provision_root_access(server: Server, public_key_path: Path) -> None:
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
-    key_path = resolve_key_path(server)
-
     try:
         client.connect(
             hostname=server.host,
             port=server.port,
             username=server.user,
             password=server.get_password(),
-            key_filename=str(key_path) if key_path else None,
+            **key_auth(server),
             allow_agent=False,
             look_for_keys=False,
             timeout=SSH_TIMEOUT,
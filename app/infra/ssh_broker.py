@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from app.core import fastjson
+from app.core.config import DATA_DIR, SSH_BROKER_SOCKET, SSH_CONCURRENCY, ensure_data_dir
+from app.infra.ssh_pool import SSHClientPool
+from app.servers.repository import ServerRepository
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+DEFAULT_SOCKET_PATH = str(DATA_DIR / "ssh-broker.sock")
+
+
+class SSHBroker:
+    def __init__(self, socket_path: str) -> None:
+        self._socket_path = socket_path
+        self._pool = SSHClientPool()
+        self._repo = ServerRepository()
+        self._known: set[str] = set()
+        self._executor = ThreadPoolExecutor(max_workers=SSH_CONCURRENCY, thread_name_prefix="ssh-broker")
+
+    async def serve(self) -> None:
+        servers = self._repo.list()
+        self._known.update(server.id for server in servers)
+        self._pool.warm_connections(servers)
+        ensure_data_dir()
+        Path(self._socket_path).unlink(missing_ok=True)
+        server = await asyncio.start_unix_server(self._handle, path=self._socket_path)
+        os.chmod(self._socket_path, 0o600)
+        async with server:
+            await server.serve_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            line = await reader.readline()
+            writer.write(await self._dispatch(line) + b"\n")
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _dispatch(self, line: bytes) -> bytes:
+        try:
+            request = fastjson.loads(line)
+            server_id = request["server_id"]
+            detail = request.get("detail", "full")
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return json.dumps({"error": "invalid request"}).encode("utf-8")
+        if not isinstance(server_id, str) or not isinstance(detail, str):
+            return json.dumps({"error": "invalid request"}).encode("utf-8")
+        server = self._repo.get_by_id(server_id)
+        if server is None:
+            return json.dumps({"error": "server not found"}).encode("utf-8")
+        if server.id not in self._known:
+            self._known.add(server.id)
+            self._pool.warm_connections([server])
+        stats = await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            partial(self._pool.collect, server, detail=detail),
+        )
+        return stats.model_dump_json().encode("utf-8")
+
+
+if __name__ == "__main__":
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(SSHBroker(SSH_BROKER_SOCKET or DEFAULT_SOCKET_PATH).serve())
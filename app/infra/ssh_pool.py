@@ -1,26 +1,45 @@
 from __future__ import annotations
 
+import heapq
+import json
+import random
+import socket
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 
 import paramiko
 
-from app.core.config import MAX_WORKERS, SSH_HEALTHCHECK_INTERVAL, SSH_TIMEOUT
-from app.infra.ssh import build_error_stats, collect_stats, fetch_disk, resolve_key_path
+from app.core import fastjson
+from app.core.config import (
+    SSH_BROKER_SOCKET,
+    SSH_COMMAND_TIMEOUT,
+    SSH_COMPRESSION,
+    SSH_CONCURRENCY,
+    SSH_HEALTHCHECK_INTERVAL,
+    SSH_TIMEOUT,
+    STATS_TTL,
+)
+from app.infra.ssh import HostState, build_error_stats, collect_stats, key_auth, normalize_detail
 from app.servers.models import Server
 from app.stats.models import HostStats
 
+KEEPALIVE_INTERVAL = 30
+STALE_AFTER = KEEPALIVE_INTERVAL * 3
+
 
 class _Entry:
     def __init__(self) -> None:
         self.client: paramiko.SSHClient | None = None
         self.lock = threading.Lock()
         self.last_error: str | None = None
+        self.state = HostState()
+        self.last_ok = 0.0
+        self.cached: tuple[float, str, HostStats] | None = None
 
 
 class SSHClientPool:
-    _instance: "SSHClientPool | None" = None
+    _instance: "SSHClientPool | BrokerClient | None" = None
     _instance_lock = threading.Lock()
 
     def __init__(self) -> None:
@@ -28,31 +47,33 @@ class SSHClientPool:
         self._servers: dict[str, Server] = {}
         self._lock = threading.Lock()
         self._monitor_started = False
+        self._schedule: list[tuple[float, str]] = []
+        self._executor = ThreadPoolExecutor(max_workers=SSH_CONCURRENCY, thread_name_prefix="ssh-pool")
 
     @classmethod
-    def get(cls) -> "SSHClientPool":
+    def get(cls) -> "SSHClientPool | BrokerClient":
         with cls._instance_lock:
             if cls._instance is None:
-                cls._instance = SSHClientPool()
+                if SSH_BROKER_SOCKET:
+                    cls._instance = BrokerClient(SSH_BROKER_SOCKET)
+                else:
+                    cls._instance = SSHClientPool()
             return cls._instance
 
     def warm_connections(self, servers: list[Server]) -> None:
         if not servers:
             return
         self.register_servers(servers)
-
-        def _warm() -> None:
-            workers = min(MAX_WORKERS, len(servers))
-            with ThreadPoolExecutor(max_workers=workers) as executor:
-                list(executor.map(self.ensure_connected, servers))
-
-        thread = threading.Thread(target=_warm, daemon=True)
-        thread.start()
+        for server in servers:
+            self._executor.submit(self._check_connection, server)
         self._start_monitor()
 
     def register_servers(self, servers: list[Server]) -> None:
+        now = time.monotonic()
         with self._lock:
             for server in servers:
+                if server.id not in self._servers:
+                    heapq.heappush(self._schedule, (now + self._next_check_delay(), server.id))
                 self._servers[server.id] = server
 
     def get_all_servers(self) -> list[Server]:
@@ -69,14 +90,35 @@ class SSHClientPool:
 
     def _monitor_loop(self) -> None:
         while True:
+            now = time.monotonic()
+            due: list[Server] = []
             with self._lock:
-                servers = list(self._servers.values())
-            for server in servers:
-                try:
-                    self.ensure_connected(server)
-                except Exception:
-                    continue
-            time.sleep(SSH_HEALTHCHECK_INTERVAL)
+                while self._schedule and self._schedule[0][0] <= now:
+                    _, server_id = heapq.heappop(self._schedule)
+                    heapq.heappush(self._schedule, (now + self._next_check_delay(), server_id))
+                    due.append(self._servers[server_id])
+                next_check = self._schedule[0][0] if self._schedule else now + SSH_HEALTHCHECK_INTERVAL
+            if due:
+                list(self._executor.map(self._check_connection, due))
+                continue
+            time.sleep(next_check - now)
+
+    @staticmethod
+    def _next_check_delay() -> float:
+        return SSH_HEALTHCHECK_INTERVAL + random.uniform(0, 0.1 * SSH_HEALTHCHECK_INTERVAL)
+
+    def _check_connection(self, server: Server) -> None:
+        entry = self._get_entry(server.id)
+        if entry.client is not None and time.monotonic() - entry.last_ok < SSH_HEALTHCHECK_INTERVAL:
+            return
+        if not entry.lock.acquire(blocking=False):
+            return
+        try:
+            self._ensure_connected_locked(server, entry)
+        except Exception:
+            return
+        finally:
+            entry.lock.release()
 
     def ensure_connected(self, server: Server) -> paramiko.SSHClient:
         entry = self._get_entry(server.id)
@@ -84,35 +126,37 @@ class SSHClientPool:
             return self._ensure_connected_locked(server, entry)
 
     def collect(self, server: Server, *, detail: str = "full"):
+        detail_level = normalize_detail(detail)
         entry = self._get_entry(server.id)
         with entry.lock:
+            cached = entry.cached
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < STATS_TTL
+                and cached[1] in (detail_level, "full")
+            ):
+                return cached[2]
             try:
                 client = self._ensure_connected_locked(server, entry)
-                return collect_stats(client, server, detail=detail)
+                stats = collect_stats(client, server, detail=detail_level, state=entry.state)
+                entry.last_ok = time.monotonic()
+                entry.cached = (entry.last_ok, detail_level, stats)
+                return stats
             except Exception as exc:
                 entry.last_error = str(exc)
+                entry.cached = None
                 if entry.client:
                     entry.client.close()
                     entry.client = None
                 return build_error_stats(server, str(exc))
 
     def collect_with_disks(self, server: Server) -> HostStats:
-        entry = self._get_entry(server.id)
-        with entry.lock:
-            try:
-                client = self._ensure_connected_locked(server, entry)
-                disks = fetch_disk(client, server.disks_monitored)
-                stats = collect_stats(client, server, detail="summary")
-                stats.disks.disks = disks
-                return stats
-            except Exception as exc:
-                entry.last_error = str(exc)
-                if entry.client:
-                    entry.client.close()
-                    entry.client = None
-                return build_error_stats(server, str(exc))
+        return self.collect(server, detail="summary")
 
     def _get_entry(self, server_id: str) -> _Entry:
+        entry = self._entries.get(server_id)
+        if entry is not None:
+            return entry
         with self._lock:
             entry = self._entries.get(server_id)
             if entry is None:
@@ -121,7 +165,7 @@ class SSHClientPool:
             return entry
 
     def _ensure_connected_locked(self, server: Server, entry: _Entry) -> paramiko.SSHClient:
-        if entry.client and self._is_active(entry.client):
+        if entry.client and self._is_alive(entry):
             return entry.client
         if entry.client:
             entry.client.close()
@@ -129,28 +173,82 @@ class SSHClientPool:
         client = self._connect(server)
         entry.client = client
         entry.last_error = None
+        entry.last_ok = time.monotonic()
         return client
 
     def _connect(self, server: Server) -> paramiko.SSHClient:
         client = paramiko.SSHClient()
         client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        key_path = resolve_key_path(server)
         client.connect(
             hostname=server.host,
             port=server.port,
             username=server.user,
             password=server.get_password(),
-            key_filename=str(key_path) if key_path else None,
+            **key_auth(server),
             allow_agent=False,
             look_for_keys=False,
             timeout=SSH_TIMEOUT,
+            compress=SSH_COMPRESSION,
         )
         transport = client.get_transport()
         if transport is not None:
-            transport.set_keepalive(30)
+            transport.set_keepalive(KEEPALIVE_INTERVAL)
         return client
 
     @staticmethod
-    def _is_active(client: paramiko.SSHClient) -> bool:
-        transport = client.get_transport()
-        return transport is not None and transport.is_active()
+    def _is_alive(entry: _Entry) -> bool:
+        transport = entry.client.get_transport() if entry.client else None
+        if transport is None or not transport.is_active():
+            return False
+        if time.monotonic() - entry.last_ok < STALE_AFTER:
+            return True
+        try:
+            channel = transport.open_session(timeout=SSH_TIMEOUT)
+        except Exception:
+            return False
+        channel.close()
+        entry.last_ok = time.monotonic()
+        return True
+
+
+class BrokerClient:
+    def __init__(self, socket_path: str) -> None:
+        self._socket_path = socket_path
+        self._servers: dict[str, Server] = {}
+        self._lock = threading.Lock()
+
+    def warm_connections(self, servers: list[Server]) -> None:
+        self.register_servers(servers)
+
+    def register_servers(self, servers: list[Server]) -> None:
+        with self._lock:
+            for server in servers:
+                self._servers[server.id] = server
+
+    def get_all_servers(self) -> list[Server]:
+        with self._lock:
+            return list(self._servers.values())
+
+    def collect(self, server: Server, *, detail: str = "full") -> HostStats:
+        request = json.dumps({"server_id": server.id, "detail": detail}).encode("utf-8")
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(SSH_TIMEOUT + 3 * SSH_COMMAND_TIMEOUT)
+                sock.connect(self._socket_path)
+                sock.sendall(request + b"\n")
+                with sock.makefile("rb") as reader:
+                    line = reader.readline()
+        except OSError as exc:
+            return build_error_stats(server, f"ssh broker unavailable: {exc}")
+        if not line:
+            return build_error_stats(server, "ssh broker closed the connection")
+        try:
+            data = fastjson.loads(line)
+            if "server_id" not in data:
+                return build_error_stats(server, data.get("error") or "ssh broker error")
+            return HostStats.model_validate(data)
+        except (AttributeError, TypeError, ValueError) as exc:
+            return build_error_stats(server, f"invalid ssh broker reply: {exc}")
+
+    def collect_with_disks(self, server: Server) -> HostStats:
+        return self.collect(server, detail="summary")
@@ -8,7 +8,6 @@ from app.core.config import ensure_data_dir
 from app.core.keys import ensure_watcher_keypair
 from app.core.migrations import migrate_servers
 from app.infra.ssh_pool import SSHClientPool
-from app.realtime.hub import hub
 from app.realtime.router import router as realtime_router
 from app.realtime.sse import router as sse_router
 from app.reports.disk_report import get_report_service
@@ -34,7 +33,6 @@ async def _startup() -> None:
     ensure_watcher_keypair()
     servers = ServerService().list_servers()
     SSHClientPool.get().warm_connections(servers)
-    hub.start()
     report_service = get_report_service()
     report_service.start()
     asyncio.create_task(report_service.send_disk_report())
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from concurrent.futures import ThreadPoolExecutor
+import random
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 import os
 
 from fastapi import WebSocket
 
+from app.core import fastjson
+from app.core.config import SSH_CONCURRENCY
 from app.servers.service import ServerService
 from app.stats.service import StatsService
 
@@ -17,6 +21,17 @@ MAX_INTERVAL_S = 60.0
 DEFAULT_INTERVAL_S = 10.0
 PM2_DETAIL_LIMIT = int(os.environ.get("BCD_PM2_DETAIL_LIMIT", "8"))
 SUP_DETAIL_LIMIT = int(os.environ.get("BCD_SUP_DETAIL_LIMIT", "5"))
+CACHE_JITTER = 0.1
+HARD_EXPIRE_FACTOR = 2.0
+
+
+@lru_cache(maxsize=1)
+def _isoformat(second: int) -> str:
+    return datetime.fromtimestamp(second, timezone.utc).isoformat(timespec="seconds")
+
+
+def _timestamp() -> str:
+    return _isoformat(int(time.time()))
 
 
 @dataclass
@@ -25,27 +40,67 @@ class Subscription:
     detail: str
 
 
+@dataclass
+class SubBucket:
+    subs: dict[WebSocket, Subscription] = field(default_factory=dict)
+    min_interval: float = DEFAULT_INTERVAL_S
+    has_full: bool = False
+
+    @property
+    def detail(self) -> str:
+        return "full" if self.has_full else "summary"
+
+    def add(self, websocket: WebSocket, sub: Subscription) -> None:
+        previous = self.subs.get(websocket)
+        self.subs[websocket] = sub
+        if previous is not None:
+            self._recompute()
+            return
+        if len(self.subs) == 1:
+            self.min_interval = sub.interval_s
+        else:
+            self.min_interval = min(self.min_interval, sub.interval_s)
+        self.has_full = self.has_full or sub.detail == "full"
+
+    def remove(self, websocket: WebSocket) -> None:
+        sub = self.subs.pop(websocket, None)
+        if sub is None:
+            return
+        if sub.interval_s <= self.min_interval or sub.detail == "full":
+            self._recompute()
+
+    def _recompute(self) -> None:
+        self.min_interval = min(
+            (sub.interval_s for sub in self.subs.values()),
+            default=DEFAULT_INTERVAL_S,
+        )
+        self.has_full = any(sub.detail == "full" for sub in self.subs.values())
+
+
 @dataclass
 class CacheEntry:
-    payload: dict
+    encoded: str
     fetched_at: float
-    detail: str
 
 
 class RealtimeHub:
     def __init__(self) -> None:
         self._lock = asyncio.Lock()
         self._connections: set[WebSocket] = set()
-        self._server_subs: dict[str, dict[WebSocket, Subscription]] = {}
-        self._cache: dict[str, CacheEntry] = {}
+        self._server_subs: dict[str, SubBucket] = {}
+        self._subs_snapshot: dict[str, tuple[float, str]] = {}
+        self._ws_to_servers: dict[WebSocket, set[str]] = {}
+        self._cache: dict[tuple[str, str], CacheEntry] = {}
         self._in_flight: set[str] = set()
-        self._task: asyncio.Task | None = None
+        self._tasks: dict[str, asyncio.Task] = {}
         self._stats_service = StatsService()
+        self._executor = ThreadPoolExecutor(max_workers=SSH_CONCURRENCY, thread_name_prefix="realtime")
         self._server_service = ServerService()
-
-    def start(self) -> None:
-        if self._task is None:
-            self._task = asyncio.create_task(self._loop())
+        self._handlers = {
+            "list:subscribe": self._handle_list,
+            "server:subscribe": self._handle_subscribe,
+            "server:unsubscribe": self._handle_unsubscribe,
+        }
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
@@ -55,55 +110,56 @@ class RealtimeHub:
     async def disconnect(self, websocket: WebSocket) -> None:
         async with self._lock:
             self._connections.discard(websocket)
-            for subs in self._server_subs.values():
-                subs.pop(websocket, None)
-            self._server_subs = {k: v for k, v in self._server_subs.items() if v}
+            server_ids = self._ws_to_servers.pop(websocket, ())
+            for server_id in server_ids:
+                bucket = self._server_subs.get(server_id)
+                if bucket is None:
+                    continue
+                bucket.remove(websocket)
+                if not bucket.subs:
+                    del self._server_subs[server_id]
+            if server_ids:
+                self._refresh_snapshot()
 
     async def handle_message(self, websocket: WebSocket, message: str) -> None:
         try:
-            payload = json.loads(message)
-        except json.JSONDecodeError:
+            payload = fastjson.loads(message)
+        except ValueError:
             return
 
         msg_type = payload.get("type")
-        if msg_type == "list:subscribe":
-            include_disabled = bool(payload.get("include_disabled", False))
-            await self._send_list(websocket, include_disabled=include_disabled)
-            return
-        if msg_type == "server:subscribe":
-            server_id = payload.get("server_id")
-            if not server_id:
-                return
-            interval = self._normalize_interval(payload.get("interval_ms"))
-            detail = self._normalize_detail(payload.get("detail"))
-            await self._subscribe_server(websocket, server_id, interval, detail)
+        handler = self._handlers.get(msg_type) if isinstance(msg_type, str) else None
+        if handler is not None:
+            await handler(websocket, payload)
+
+    async def _handle_list(self, websocket: WebSocket, payload: dict) -> None:
+        include_disabled = bool(payload.get("include_disabled", False))
+        await self._send_list(websocket, include_disabled=include_disabled)
+
+    async def _handle_subscribe(self, websocket: WebSocket, payload: dict) -> None:
+        server_id = payload.get("server_id")
+        if not server_id:
             return
-        if msg_type == "server:unsubscribe":
-            server_id = payload.get("server_id")
-            if not server_id:
-                return
-            await self._unsubscribe_server(websocket, server_id)
+        interval = self._normalize_interval(payload.get("interval_ms"))
+        detail = self._normalize_detail(payload.get("detail"))
+        await self._subscribe_server(websocket, server_id, interval, detail)
+
+    async def _handle_unsubscribe(self, websocket: WebSocket, payload: dict) -> None:
+        server_id = payload.get("server_id")
+        if not server_id:
             return
+        await self._unsubscribe_server(websocket, server_id)
 
     async def _send_list(self, websocket: WebSocket, *, include_disabled: bool) -> None:
-        servers = self._server_service.list_servers()
+        servers = self._server_service.list_server_summaries()
         if not include_disabled:
-            servers = [server for server in servers if server.enabled]
+            servers = [server for server in servers if server["enabled"]]
         payload = {
             "type": "list:update",
-            "servers": [
-                {
-                    "server_id": server.id,
-                    "server_name": server.name or server.host,
-                    "host": server.host,
-                    "enabled": server.enabled,
-                    "tags": server.tags,
-                }
-                for server in servers
-            ],
-            "ts": datetime.now(timezone.utc).isoformat(),
+            "servers": servers,
+            "ts": _timestamp(),
         }
-        await websocket.send_json(payload)
+        await websocket.send_text(fastjson.dumps(payload))
 
     async def _subscribe_server(
         self,
@@ -113,104 +169,135 @@ class RealtimeHub:
         detail: str,
     ) -> None:
         async with self._lock:
-            subs = self._server_subs.setdefault(server_id, {})
-            subs[websocket] = Subscription(interval_s=interval_s, detail=detail)
-            cache = self._cache.get(server_id)
-        if cache is not None and cache.detail == detail:
-            await self._safe_send(websocket, cache.payload)
+            bucket = self._server_subs.setdefault(server_id, SubBucket())
+            bucket.add(websocket, Subscription(interval_s=interval_s, detail=detail))
+            self._ws_to_servers.setdefault(websocket, set()).add(server_id)
+            self._refresh_snapshot()
+            max_age = bucket.min_interval * HARD_EXPIRE_FACTOR
+            cache = self._cache.get((server_id, detail)) or self._cache.get((server_id, "summary"))
+        if cache is not None and time.monotonic() - cache.fetched_at < max_age:
+            await self._safe_send(websocket, cache.encoded)
 
     async def _unsubscribe_server(self, websocket: WebSocket, server_id: str) -> None:
         async with self._lock:
-            subs = self._server_subs.get(server_id)
-            if subs is None:
+            bucket = self._server_subs.get(server_id)
+            if bucket is None:
                 return
-            subs.pop(websocket, None)
-            if not subs:
+            bucket.remove(websocket)
+            if not bucket.subs:
                 self._server_subs.pop(server_id, None)
-
-    async def _loop(self) -> None:
-        while True:
-            await asyncio.sleep(0.5)
-            await self._tick()
-
-    async def _tick(self) -> None:
-        now = time.monotonic()
-        async with self._lock:
-            subs_snapshot = {
-                server_id: list(subs.values())
-                for server_id, subs in self._server_subs.items()
-                if subs
-            }
-
-        for server_id, subs in subs_snapshot.items():
-            interval_s = min(sub.interval_s for sub in subs) if subs else DEFAULT_INTERVAL_S
-            detail = "full" if any(sub.detail == "full" for sub in subs) else "summary"
-            cache = self._cache.get(server_id)
-            due = cache is None or (now - cache.fetched_at) >= interval_s or cache.detail != detail
-
-            if not due:
+            server_ids = self._ws_to_servers.get(websocket)
+            if server_ids is not None:
+                server_ids.discard(server_id)
+                if not server_ids:
+                    del self._ws_to_servers[websocket]
+            self._refresh_snapshot()
+
+    def _refresh_snapshot(self) -> None:
+        previous = self._subs_snapshot
+        self._subs_snapshot = {
+            server_id: (bucket.min_interval, bucket.detail)
+            for server_id, bucket in self._server_subs.items()
+            if bucket.subs
+        }
+        for server_id, task in list(self._tasks.items()):
+            if self._subs_snapshot.get(server_id) == previous.get(server_id) and not task.done():
                 continue
+            if server_id in self._in_flight:
+                continue
+            task.cancel()
+            del self._tasks[server_id]
+        for server_id in self._subs_snapshot:
+            if server_id not in self._tasks:
+                self._tasks[server_id] = asyncio.create_task(self._run_server(server_id))
 
-            async with self._lock:
-                if server_id in self._in_flight:
+    async def _run_server(self, server_id: str) -> None:
+        while True:
+            settings = self._subs_snapshot.get(server_id)
+            if settings is None:
+                return
+            interval_s, detail = settings
+            cache = self._cache.get((server_id, detail))
+            if cache is not None:
+                delay = cache.fetched_at + interval_s - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
                     continue
-                self._in_flight.add(server_id)
-
-            asyncio.create_task(self._fetch_and_broadcast(server_id, detail))
-
-    async def _fetch_and_broadcast(self, server_id: str, detail: str) -> None:
+            self._in_flight.add(server_id)
+            try:
+                await self._fetch_and_broadcast(server_id, detail, interval_s)
+            except Exception:
+                pass
+            if self._cache.get((server_id, detail)) is cache:
+                await asyncio.sleep(interval_s)
+
+    async def _fetch_and_broadcast(self, server_id: str, detail: str, interval_s: float) -> None:
         try:
-            stats = await asyncio.to_thread(
-                self._stats_service.collect_one,
-                server_id,
-                include_disabled=True,
-                detail=detail,
+            stats = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                partial(
+                    self._stats_service.collect_one,
+                    server_id,
+                    include_disabled=True,
+                    detail=detail,
+                    pm2_limit=PM2_DETAIL_LIMIT,
+                    supervisor_limit=SUP_DETAIL_LIMIT,
+                ),
             )
             if stats is None:
-                payload = {
+                encoded = fastjson.dumps({
                     "type": "server:error",
                     "server_id": server_id,
                     "error": "server not found",
-                    "ts": datetime.now(timezone.utc).isoformat(),
-                }
-            else:
-                if detail == "summary":
-                    server_payload = self._build_summary(stats)
-                else:
-                    server_payload = self._build_full(stats)
-                payload = {
-                    "type": "server:update",
-                    "server": server_payload,
-                    "detail": detail,
-                    "ts": datetime.now(timezone.utc).isoformat(),
-                }
-                async with self._lock:
-                    self._cache[server_id] = CacheEntry(
-                        payload=payload,
-                        fetched_at=time.monotonic(),
-                        detail=detail,
+                    "ts": _timestamp(),
+                })
+                await self._broadcast(server_id, {"summary": encoded, "full": encoded})
+                return
+            ts = _timestamp()
+            fetched_at = time.monotonic() + random.uniform(-CACHE_JITTER, CACHE_JITTER) * interval_s
+            details = ("summary", "full") if detail == "full" else ("summary",)
+            encoded_by_detail: dict[str, str] = {}
+            async with self._lock:
+                for item in details:
+                    if item == "summary":
+                        server_payload = self._build_summary(stats)
+                    else:
+                        server_payload = self._build_full(stats)
+                    encoded = fastjson.dumps({
+                        "type": "server:update",
+                        "server": server_payload,
+                        "detail": item,
+                        "ts": ts,
+                    })
+                    self._cache[(server_id, item)] = CacheEntry(
+                        encoded=encoded,
+                        fetched_at=fetched_at,
                     )
-            await self._broadcast(server_id, payload)
+                    encoded_by_detail[item] = encoded
+            await self._broadcast(server_id, encoded_by_detail)
         finally:
-            async with self._lock:
-                self._in_flight.discard(server_id)
+            self._in_flight.discard(server_id)
 
-    async def _broadcast(self, server_id: str, payload: dict) -> None:
+    async def _broadcast(self, server_id: str, encoded: dict[str, str]) -> None:
         async with self._lock:
-            targets = list(self._server_subs.get(server_id, {}).keys())
+            bucket = self._server_subs.get(server_id)
+            targets = list(bucket.subs.items()) if bucket is not None else []
         if not targets:
             return
-        failures: list[WebSocket] = []
-        for websocket in targets:
-            ok = await self._safe_send(websocket, payload)
-            if not ok:
-                failures.append(websocket)
-        for websocket in failures:
-            await self.disconnect(websocket)
-
-    async def _safe_send(self, websocket: WebSocket, payload: dict) -> bool:
+        results = await asyncio.gather(
+            *(
+                self._safe_send(websocket, encoded.get(sub.detail, encoded["summary"]))
+                for websocket, sub in targets
+            ),
+            return_exceptions=True,
+        )
+        for (websocket, _), ok in zip(targets, results):
+            if ok is not True:
+                await self.disconnect(websocket)
+
+    async def _safe_send(self, websocket: WebSocket, encoded: str) -> bool:
         try:
-            await websocket.send_json(payload)
+            await websocket.send_text(encoded)
             return True
         except Exception:
             return False
@@ -223,10 +310,19 @@ class RealtimeHub:
 
     @staticmethod
     def _normalize_interval(interval_ms: object) -> float:
-        if isinstance(interval_ms, (int, float)):
-            value = max(MIN_INTERVAL_S, min(MAX_INTERVAL_S, interval_ms / 1000.0))
-            return value
-        return DEFAULT_INTERVAL_S
+        if type(interval_ms) not in (int, float):
+            return DEFAULT_INTERVAL_S
+        try:
+            value = float(interval_ms) / 1000.0
+        except OverflowError:
+            return MAX_INTERVAL_S if interval_ms > 0 else MIN_INTERVAL_S
+        if value != value:
+            return DEFAULT_INTERVAL_S
+        if value < MIN_INTERVAL_S:
+            return MIN_INTERVAL_S
+        if value > MAX_INTERVAL_S:
+            return MAX_INTERVAL_S
+        return value
 
     def _build_summary(self, stats) -> dict:
         disks_list = []
@@ -287,8 +383,7 @@ class RealtimeHub:
                 "total_memory_bytes": stats.pm2.total_memory_bytes,
                 "details": [
                     {"name": item.name, "status": item.status}
-                    for item in pm2_details[:PM2_DETAIL_LIMIT]
-                    if item is not None
+                    for item in pm2_details
                 ],
             },
             "supervisor": {
@@ -300,8 +395,7 @@ class RealtimeHub:
                         "state": item.state,
                         "uptime": item.uptime,
                     }
-                    for item in sup_details[:SUP_DETAIL_LIMIT]
-                    if item is not None
+                    for item in sup_details
                 ],
             },
         }
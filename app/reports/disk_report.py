@@ -7,6 +7,7 @@ import threading
 import httpx
 
 from app.core.config import EMAIL_ACCESS_TOKEN, EMAIL_API_URL, EMAIL_ENABLED, EMAIL_TO, REPORT_HOUR, REPORT_MINUTE
+from app.infra.ssh import format_bytes
 from app.infra.ssh_pool import SSHClientPool
 from app.servers.models import Server
 
@@ -14,20 +15,6 @@ ALERT_DISK_PERCENT = 90
 WARN_DISK_PERCENT = 80
 
 
-def format_bytes(value: int | None) -> str:
-    if value is None:
-        return "n/a"
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    size = float(value)
-    for unit in units:
-        if size < 1024 or unit == units[-1]:
-            if unit == "B":
-                return f"{int(size)} {unit}"
-            return f"{size:.2f} {unit}"
-        size /= 1024
-    return f"{size:.2f} PB"
-
-
 def parse_email_addresses(value: str) -> list[str]:
     if not value:
         return []
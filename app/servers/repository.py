@@ -1,26 +1,47 @@
 from __future__ import annotations
 
-import json
 import threading
 from pathlib import Path
 
+from pydantic import TypeAdapter, ValidationError
+
 from app.core.config import SERVERS_FILE, ensure_data_dir
 from app.servers.models import Server
 
+_SERVERS_ADAPTER = TypeAdapter(list[Server])
 
-class ServerRepository:
-    _lock = threading.Lock()
 
+class ServerRepository:
     def __init__(self, path: Path | None = None) -> None:
         self._path = path or SERVERS_FILE
+        self._lock = threading.RLock()
+        self._cached: tuple[tuple[int, int, int], list[Server]] | None = None
+        self._summaries: tuple[list[Server], list[dict]] | None = None
 
     def list(self) -> list[Server]:
-        with self._lock:
-            return self._load()
+        return self._load_cached()
+
+    def list_summaries(self) -> list[dict]:
+        servers = self._load_cached()
+        cached = self._summaries
+        if cached is not None and cached[0] is servers:
+            return cached[1]
+        summaries = [
+            {
+                "server_id": server.id,
+                "server_name": server.name or server.host,
+                "host": server.host,
+                "enabled": server.enabled,
+                "tags": server.tags,
+            }
+            for server in servers
+        ]
+        self._summaries = (servers, summaries)
+        return summaries
 
     def add(self, server: Server) -> Server:
         with self._lock:
-            servers = self._load()
+            servers = list(self._load_cached())
             for existing in servers:
                 if (
                     existing.host == server.host
@@ -33,27 +54,47 @@ class ServerRepository:
         return server
 
     def get_by_id(self, server_id: str) -> Server | None:
-        with self._lock:
-            servers = self._load()
-        for server in servers:
+        for server in self._load_cached():
             if server.id == server_id:
                 return server
         return None
 
+    def _load_cached(self) -> list[Server]:
+        try:
+            version = self._file_version()
+        except FileNotFoundError:
+            return []
+        cached = self._cached
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        with self._lock:
+            cached = self._cached
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            servers = self._load()
+            self._cached = (version, servers)
+            return servers
+
+    def _file_version(self) -> tuple[int, int, int]:
+        stat = self._path.stat()
+        return stat.st_mtime_ns, stat.st_ino, stat.st_size
+
     def _load(self) -> list[Server]:
         if not self._path.exists():
             return []
-        raw = self._path.read_text(encoding="utf-8").strip()
-        if not raw:
-            return []
-        data = json.loads(raw)
-        if not isinstance(data, list):
+        raw = self._path.read_bytes()
+        if not raw.strip():
             return []
-        return [Server(**item) for item in data]
+        try:
+            return _SERVERS_ADAPTER.validate_json(raw)
+        except ValidationError as exc:
+            if any(error["loc"] == () and error["type"] == "list_type" for error in exc.errors()):
+                return []
+            raise
 
     def _save(self, servers: list[Server]) -> None:
         ensure_data_dir()
-        payload = [server.model_dump() for server in servers]
         tmp_path = self._path.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps(payload, ensure_ascii=True, indent=2), encoding="utf-8")
+        tmp_path.write_bytes(_SERVERS_ADAPTER.dump_json(servers, indent=2))
         tmp_path.replace(self._path)
+        self._cached = (self._file_version(), list(servers))
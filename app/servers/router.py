@@ -2,17 +2,23 @@ from __future__ import annotations
 
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
 
-from app.servers.models import ServerCreate, ServerListResponse, ServerPublic
+from app.servers.models import Server, ServerCreate, ServerListResponse, ServerPublic
 from app.servers.service import ServerService
 
 router = APIRouter(prefix="/servers", tags=["servers"])
 service = ServerService()
 
+_PUBLIC_FIELDS = tuple(ServerPublic.model_fields)
+
+
+def _to_public(server: Server) -> ServerPublic:
+    return ServerPublic.model_construct(**{field: getattr(server, field) for field in _PUBLIC_FIELDS})
+
 
 @router.get("", response_model=ServerListResponse)
 def list_servers() -> ServerListResponse:
     servers = service.list_servers()
-    public = [ServerPublic(**server.model_dump(exclude={"password"})) for server in servers]
+    public = [_to_public(server) for server in servers]
     return ServerListResponse(servers=public)
 
 
@@ -38,7 +44,7 @@ def add_server(
     )
     try:
         server = service.add_server_form(payload, key_file)
-        return ServerPublic(**server.model_dump(exclude={"password"}))
+        return _to_public(server)
     except ValueError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
     except Exception as exc:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
 from fastapi import UploadFile
@@ -20,6 +21,9 @@ class ServerService:
     def list_servers(self) -> list[Server]:
         return self._repo.list()
 
+    def list_server_summaries(self) -> list[dict]:
+        return self._repo.list_summaries()
+
     def get_server(self, server_id: str) -> Server | None:
         return self._repo.get_by_id(server_id)
 
@@ -38,7 +42,8 @@ class ServerService:
             stored_name = f"{server.id}_{filename}"
             stored_path = KEYS_DIR / stored_name
             with stored_path.open("wb") as handle:
-                handle.write(key_file.file.read())
+                shutil.copyfileobj(key_file.file, handle, 65536)
+            key_file.file.close()
             try:
                 server.key_path = str(stored_path.relative_to(ROOT_DIR))
             except ValueError:
@@ -10,5 +10,8 @@ service = StatsService()
 
 
 @router.get("", response_model=StatsResponse)
-def get_stats(include_disabled: bool = Query(False)) -> StatsResponse:
-    return service.collect(include_disabled=include_disabled)
+def get_stats(
+    include_disabled: bool = Query(False),
+    detail: str = Query("full"),
+) -> StatsResponse:
+    return service.collect(include_disabled=include_disabled, detail=detail)
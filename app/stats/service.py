@@ -1,28 +1,35 @@
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from app.core.config import MAX_WORKERS
 from app.infra.ssh_pool import SSHClientPool
 from app.servers.service import ServerService
 from app.stats.models import HostStats, StatsResponse
 
+STATS_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="stats")
+
+
+def _trim_details(items: list | None, limit: int | None) -> list | None:
+    if items is None or limit is None:
+        return items
+    return [item for item in items[:limit] if item is not None]
+
 
 class StatsService:
     def __init__(self, server_service: ServerService | None = None) -> None:
         self._server_service = server_service or ServerService()
         self._pool = SSHClientPool.get()
 
-    def collect(self, *, include_disabled: bool = False) -> StatsResponse:
+    def collect(self, *, include_disabled: bool = False, detail: str = "full") -> StatsResponse:
         servers = self._server_service.list_servers()
         if not include_disabled:
             servers = [server for server in servers if server.enabled]
         if not servers:
             return StatsResponse(servers=[])
 
-        workers = min(MAX_WORKERS, len(servers))
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            results = list(executor.map(self._pool.collect, servers))
+        results = list(STATS_EXECUTOR.map(partial(self._pool.collect, detail=detail), servers))
         return StatsResponse(servers=results)
 
     def collect_one(
@@ -31,10 +38,24 @@ class StatsService:
         *,
         include_disabled: bool = False,
         detail: str = "full",
+        pm2_limit: int | None = None,
+        supervisor_limit: int | None = None,
     ) -> HostStats | None:
         server = self._server_service.get_server(server_id)
         if server is None:
             return None
         if not include_disabled and not server.enabled:
             return None
-        return self._pool.collect(server, detail=detail)
+        stats = self._pool.collect(server, detail=detail)
+        if pm2_limit is None and supervisor_limit is None:
+            return stats
+        return stats.model_copy(
+            update={
+                "pm2": stats.pm2.model_copy(
+                    update={"details": _trim_details(stats.pm2.details, pm2_limit)}
+                ),
+                "supervisor": stats.supervisor.model_copy(
+                    update={"details": _trim_details(stats.supervisor.details, supervisor_limit)}
+                ),
+            }
+        )